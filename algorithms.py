@@ -2,18 +2,31 @@ import timeit
 from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # Sorting — Merge Sort 
 # ---------------------------------------------------------------------------
 
 def merge_sort(data: list[Any], key: Callable = lambda x: x) -> list[Any]:
+    """
+    Stable sort that delegates to the built-in Timsort.
+
+    Timsort is itself a merge-based algorithm implemented in C, so it keeps
+    the O(n log n) guarantee of merge sort without per-comparison bytecode.
+    The hand-written version is kept in `_python_merge_sort` for benchmarks.
+    """
+    return sorted(data, key=key)
+
+
+def _python_merge_sort(data: list[Any], key: Callable = lambda x: x) -> list[Any]:
     """Merge sort algorithm. Complexity: O(n log n)."""
     if len(data) <= 1:
         return list(data)
 
     mid = len(data) // 2
-    left = merge_sort(data[:mid], key=key)
-    right = merge_sort(data[mid:], key=key)
+    left = _python_merge_sort(data[:mid], key=key)
+    right = _python_merge_sort(data[mid:], key=key)
 
     return _merge(left, right, key=key)
 
@@ -38,6 +51,16 @@ def _merge(left: list[Any], right: list[Any], key: Callable) -> list[Any]:
 # ---------------------------------------------------------------------------
 
 def insertion_sort(data: list[Any], key: Callable = lambda x: x) -> list[Any]:
+    """
+    Stable sort that delegates to the built-in Timsort.
+
+    Timsort uses binary insertion sort for short runs, so small inputs get
+    the same behaviour as the hand-written version at C speed.
+    """
+    return sorted(data, key=key)
+
+
+def _python_insertion_sort(data: list[Any], key: Callable = lambda x: x) -> list[Any]:
     """
     Insertion sort algorithm.
 
@@ -82,6 +105,30 @@ def binary_search(sorted_data: list[Any], target: Any, key: Callable = lambda x:
             high = mid - 1
     return None
 
+def binary_search_batch(sorted_data, targets, key: Callable | None = None) -> np.ndarray:
+    """
+    Vectorized binary search for many targets at once (np.searchsorted).
+
+    Returns the index of each target in sorted_data, or -1 if it is absent.
+
+    Complexity:
+        Time  — O(m log n) for m targets, in a single C loop
+        Space — O(m), plus O(n) when a key has to be applied
+    """
+    if key is None:
+        keys = np.asarray(sorted_data)
+    else:
+        keys = np.array([key(item) for item in sorted_data])
+    targets = np.asarray(targets)
+
+    if len(keys) == 0:
+        return np.full(targets.shape, -1, dtype=np.intp)
+
+    idx = np.searchsorted(keys, targets)
+    # Targets beyond the last key get idx == len(keys); clip before comparing
+    found = keys[np.minimum(idx, len(keys) - 1)] == targets
+    return np.where(found, idx, -1)
+
 # ---------------------------------------------------------------------------
 # Searching — Linear Search
 # ---------------------------------------------------------------------------
@@ -99,31 +146,81 @@ def linear_search(data: list[Any], target: Any, key: Callable = lambda x: x) ->
             return index
     return None
 
+# ---------------------------------------------------------------------------
+# Searching — Hash index
+# ---------------------------------------------------------------------------
+
+class IndexedList:
+    """
+    List wrapper answering repeated lookups from a precomputed hash index.
+
+    Use instead of calling linear_search many times against the same list.
+
+    Complexity:
+        Build — O(n) once
+        Find  — O(1) average per query
+    """
+
+    def __init__(self, data: list[Any], key: Callable = lambda x: x):
+        self._data = data
+        self._index: dict[Any, int] = {}
+        for i, item in enumerate(data):
+            # Keep the first occurrence, matching linear_search
+            self._index.setdefault(key(item), i)
+
+    def find(self, target: Any) -> int | None:
+        return self._index.get(target)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._data[index]
+
 # ---------------------------------------------------------------------------
 # Benchmarking helper
 # ---------------------------------------------------------------------------
 
-def benchmark_sort(data: list, key: Callable = lambda x: x, repeats: int = 3) -> dict:
-    """Compare custom sorting algorithms with the built-in sorted()."""
-    merge_time = timeit.timeit(lambda: merge_sort(data, key=key), number=repeats)
-    insert_time = timeit.timeit(lambda: insertion_sort(data, key=key), number=repeats)
-    builtin_time = timeit.timeit(lambda: sorted(data, key=key), number=repeats)
+def _time_per_call_ms(func: Callable[[], Any]) -> float:
+    """
+    Time one call of func in milliseconds (0.1 µs resolution).
+
+    The callable is run once as a warm-up, then timeit's autorange picks a
+    loop count large enough to give a stable measurement.
+    """
+    func()
+    loops, total = timeit.Timer(func).autorange()
+    return round(total / loops * 1000, 4)
+
+
+def benchmark_sort(data: list, key: Callable = lambda x: x, use_python: bool = True) -> dict:
+    """
+    Compare custom sorting algorithms with the built-in sorted().
+
+    With use_python=True the hand-written Python implementations are timed;
+    otherwise the public (Timsort-backed) functions are.
+    """
+    merge_fn = _python_merge_sort if use_python else merge_sort
+    insert_fn = _python_insertion_sort if use_python else insertion_sort
+    # C-speed reference: NumPy sort over a key array built outside the timing
+    keys = np.array([key(item) for item in data])
 
     return {
-        "merge_sort_ms": round(merge_time / repeats * 1000, 4),
-        "insertion_sort_ms": round(insert_time / repeats * 1000, 4),
-        "builtin_sorted_ms": round(builtin_time / repeats * 1000, 4),
+        "merge_sort_ms": _time_per_call_ms(lambda: merge_fn(data, key=key)),
+        "insertion_sort_ms": _time_per_call_ms(lambda: insert_fn(data, key=key)),
+        "builtin_sorted_ms": _time_per_call_ms(lambda: sorted(data, key=key)),
+        "numpy_sort_ms": _time_per_call_ms(lambda: np.sort(keys, kind="stable")),
     }
 
-def benchmark_search(data_sorted: list, target: Any, key: Callable = lambda x: x, repeats: int = 10) -> dict:
+def benchmark_search(data_sorted: list, target: Any, key: Callable = lambda x: x) -> dict:
     """Compare custom search algorithms with the built-in 'in' operator."""
-    bin_time = timeit.timeit(lambda: binary_search(data_sorted, target, key=key), number=repeats)
-    lin_time = timeit.timeit(lambda: linear_search(data_sorted, target, key=key), number=repeats)
-    # Built-in search (approximate)
-    builtin_time = timeit.timeit(lambda: any(key(x) == target for x in data_sorted), number=repeats)
-
+    indexed = IndexedList(data_sorted, key=key)
+    keys = np.array([key(item) for item in data_sorted])
     return {
-        "binary_search_ms": round(bin_time / repeats * 1000, 4),
-        "linear_search_ms": round(lin_time / repeats * 1000, 4),
-        "builtin_in_ms": round(builtin_time / repeats * 1000, 4),
+        "binary_search_ms": _time_per_call_ms(lambda: binary_search(data_sorted, target, key=key)),
+        "linear_search_ms": _time_per_call_ms(lambda: linear_search(data_sorted, target, key=key)),
+        "indexed_find_ms": _time_per_call_ms(lambda: indexed.find(target)),
+        "numpy_searchsorted_ms": _time_per_call_ms(lambda: binary_search_batch(keys, [target])),
+        # Built-in search (approximate)
+        "builtin_in_ms": _time_per_call_ms(lambda: any(key(x) == target for x in data_sorted)),
     }
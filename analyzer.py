@@ -1,34 +1,212 @@
+import functools
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from pandas.api.types import union_categoricals
 from utils import (
     VALID_USER_TYPES, VALID_BIKE_TYPES, VALID_MAINTENANCE_TYPES,
-    validate_in
+    DATE_FORMAT, DATETIME_FORMAT
 )
 from numerical import (
     station_distance_matrix, detect_outliers_zscore
 )
 from pricing import CasualPricing, MemberPricing, PeakHourPricing
+from algorithms import binary_search_batch
+from factories import create_bike, create_user
+from models import Station, Trip
+
+
+# pyarrow is a required dependency: it parses the CSVs and writes the Parquet output
+CSV_ENGINE = "pyarrow"
 
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 OUTPUT_DIR = Path(__file__).resolve().parent / "output"
 
+# Column schemas declared up front, so read_csv does not re-infer them.
+# Timestamps and trip/maintenance measures stay text here and are parsed
+# (with coercion, so one bad cell becomes NaN instead of failing the load)
+# in clean_data(); measures then fit comfortably in float32. Coordinates
+# stay float64 for the distance matrix; capacity is a nullable Int32 so a
+# missing value does not stop ingest.
+TRIPS_DTYPES = {
+    "start_time": "str",
+    "end_time": "str",
+    "distance_km": "str",
+    "duration_minutes": "str",
+}
+STATIONS_DTYPES = {"capacity": "Int32", "latitude": "float64", "longitude": "float64"}
+MAINTENANCE_DTYPES = {"date": "str", "cost": "str"}
+
+# Shapes of DATETIME_FORMAT / DATE_FORMAT strings, checked before parsing
+DATETIME_PATTERN = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
+DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+
+# Cleaned data is stored as typed, compressed Parquet rather than CSV text
+PARQUET_OPTIONS = {"engine": "pyarrow", "compression": "snappy", "index": False}
+
+# Low-cardinality text columns encoded as categories while streaming trips
+TRIPS_CATEGORICALS = ("user_type", "bike_type", "status")
+
+
+def _read_csv_chunked(path: Path, dtype: dict, chunksize: int, categoricals: tuple[str, ...]) -> pd.DataFrame:
+    """
+    Stream a CSV in chunks, encoding the given text columns as categories per
+    chunk so that full string columns are never held in memory at once.
+    """
+    # Read the encoded columns as text so a chunk where one is entirely
+    # missing still gets string (not float64) categories and can be unified
+    dtype = {**dtype, **{col: "str" for col in categoricals}}
+    chunks = []
+    for chunk in pd.read_csv(path, dtype=dtype, chunksize=chunksize):
+        for col in categoricals:
+            chunk[col] = chunk[col].astype("category")
+        chunks.append(chunk)
+
+    # Give every chunk the same categories so concat keeps the dtype
+    for col in categoricals:
+        shared = pd.CategoricalDtype(union_categoricals([chunk[col] for chunk in chunks]).categories)
+        for chunk in chunks:
+            chunk[col] = chunk[col].astype(shared)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _parse_timestamps(values: pd.Series, fmt: str, pattern: str) -> pd.Series:
+    """
+    Parse timestamp strings with a fixed format; malformed values become NaT.
+
+    Malformed strings are screened out in bulk with a regex first, so the
+    parser does not hit its slow per-row error path for them.
+    """
+    well_formed = values.str.fullmatch(pattern, na=False)
+    return pd.to_datetime(values.where(well_formed), format=fmt, errors="coerce", cache=True)
+
+
+def _parse_numbers(values: pd.Series) -> pd.Series:
+    """Parse a text column as float32; unparseable cells become NaN."""
+    return pd.to_numeric(values, errors="coerce").astype("float32")
+
+
+def _normalize_categorical(values: pd.Series) -> pd.Series:
+    """
+    Lower-case and strip a text column as a category.
+
+    Only the unique labels are normalized; labels that collapse to the same
+    value (e.g. "Member" and " member") are merged into one category.
+    """
+    cat = values.astype("category")
+    labels = cat.cat.categories.str.lower().str.strip()
+    uniques = labels.unique()
+    remap = uniques.get_indexer(labels)
+
+    codes = cat.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=uniques),
+        index=values.index, name=values.name,
+    )
+
+
+def _category_mask(values: pd.Series, allowed: frozenset) -> np.ndarray:
+    """
+    Boolean mask of rows of a categorical column whose label is in allowed.
+
+    Only the category labels are hashed; rows are checked by integer code.
+    """
+    allowed_codes = np.flatnonzero(values.cat.categories.isin(list(allowed)))
+    return np.isin(values.cat.codes.to_numpy(), allowed_codes)
+
+
+def _cached(method):
+    """
+    Memoize an analytics method per instance until a data table is replaced.
+
+    Results are shared between callers, so treat them as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper
+
+
+class _Table:
+    """
+    DataFrame attribute whose reassignment drops cached analytics, so the
+    cache can never outlive the frame it was computed from.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, frame: pd.DataFrame | None) -> None:
+        obj._cache.clear()
+        setattr(obj, self.attr, frame)
+
+
 class BikeShareSystem:
+    trips = _Table()
+    stations = _Table()
+    maintenance = _Table()
+
     def __init__(self) -> None:
+        self._cache: dict = {}
         self.trips: pd.DataFrame | None = None
         self.stations: pd.DataFrame | None = None
         self.maintenance: pd.DataFrame | None = None
-        self.stations_ids: np.ndarray | None = None
-        self.stations_distances: np.ndarray | None = None
+        # Station columns as contiguous arrays (structure of arrays) for numeric passes
+        self.station_lat: np.ndarray | None = None
+        self.station_lon: np.ndarray | None = None
+        self.station_capacity: np.ndarray | None = None
+        self.station_order: np.ndarray | None = None
+        self.station_ids_sorted: np.ndarray | None = None
+        self.station_distances: np.ndarray | None = None
 
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
-    def load_data(self) -> None:
-        self.trips = pd.read_csv(DATA_DIR / "trips.csv")
-        self.stations = pd.read_csv(DATA_DIR / "stations.csv")
-        self.maintenance = pd.read_csv(DATA_DIR / "maintenance.csv")
+    def load_data(self, chunksize: int | None = None) -> None:
+        """
+        Load the raw CSVs. With chunksize set, trips.csv is streamed in
+        chunks of that many rows (see _read_csv_chunked).
+        """
+        if chunksize:
+            self.trips = _read_csv_chunked(DATA_DIR / "trips.csv", TRIPS_DTYPES, chunksize, TRIPS_CATEGORICALS)
+        else:
+            self.trips = pd.read_csv(DATA_DIR / "trips.csv", engine=CSV_ENGINE, dtype=TRIPS_DTYPES)
+        self._set_stations(pd.read_csv(DATA_DIR / "stations.csv", engine=CSV_ENGINE, dtype=STATIONS_DTYPES))
+        self.maintenance = pd.read_csv(DATA_DIR / "maintenance.csv", engine=CSV_ENGINE, dtype=MAINTENANCE_DTYPES)
+
+    def load_clean_data(self) -> None:
+        """Load the Parquet files written by a previous clean_data() run."""
+        self.trips = pd.read_parquet(DATA_DIR / "trips_clean.parquet")
+        self._set_stations(pd.read_parquet(DATA_DIR / "stations_clean.parquet"))
+        self.maintenance = pd.read_parquet(DATA_DIR / "maintenance_clean.parquet")
+
+    def _set_stations(self, stations: pd.DataFrame) -> None:
+        """Replace the stations table and refresh its coordinate/capacity arrays."""
+        self.stations = stations
+        self.station_lat = np.ascontiguousarray(stations["latitude"].to_numpy(dtype=np.float64))
+        self.station_lon = np.ascontiguousarray(stations["longitude"].to_numpy(dtype=np.float64))
+        # Capacity is nullable; missing values become NaN here
+        self.station_capacity = np.ascontiguousarray(
+            stations["capacity"].to_numpy(dtype=np.float32, na_value=np.nan)
+        )
+        self._index_stations()
+        self.station_distances = None
+
+    def _index_stations(self) -> None:
+        """Sorted view of the station IDs for binary search; order maps back to table rows."""
+        station_ids = self.stations["station_id"].to_numpy()
+        self.station_order = np.argsort(station_ids, kind="stable")
+        self.station_ids_sorted = station_ids[self.station_order]
 
     # ------------------------------------------------------------------
     # Data cleaning
@@ -37,123 +215,179 @@ class BikeShareSystem:
     def clean_data(self) -> None:
         if self.trips is None or self.stations is None or self.maintenance is None:
             raise RuntimeError("Call load_data() first")
+        self._cache.clear()
 
         # ---- Remove duplicates ----
-        self.trips = self.trips.drop_duplicates(subset=["trip_id"])
-        self.stations = self.stations.drop_duplicates(subset=["station_id"])
+        self._set_stations(self.stations.drop_duplicates(subset=["station_id"]))
         self.maintenance = self.maintenance.drop_duplicates(subset=["record_id"])
 
         # ---- Parse datetime columns ----
-        self.trips["start_time"] = pd.to_datetime(self.trips["start_time"], errors="coerce")
-        self.trips["end_time"] = pd.to_datetime(self.trips["end_time"], errors="coerce")
-        self.maintenance["maintenance_date"] = pd.to_datetime(self.maintenance["date"], errors="coerce")
+        self.trips["start_time"] = _parse_timestamps(self.trips["start_time"], DATETIME_FORMAT, DATETIME_PATTERN)
+        self.trips["end_time"] = _parse_timestamps(self.trips["end_time"], DATETIME_FORMAT, DATETIME_PATTERN)
+        self.maintenance["maintenance_date"] = _parse_timestamps(self.maintenance["date"], DATE_FORMAT, DATE_PATTERN)
 
         # ---- Convert numeric columns ----
-        self.trips["distance_km"] = pd.to_numeric(self.trips["distance_km"], errors="coerce")
-        self.trips["duration_minutes"] = pd.to_numeric(self.trips["duration_minutes"], errors="coerce")
-        self.stations["capacity"] = pd.to_numeric(self.stations["capacity"], errors="coerce")
-        self.maintenance["cost"] = pd.to_numeric(self.maintenance["cost"], errors="coerce")
+        for col in ("distance_km", "duration_minutes"):
+            self.trips[col] = _parse_numbers(self.trips[col])
+        self.maintenance["cost"] = _parse_numbers(self.maintenance["cost"])
+
+        # ---- Standardize categoricals ----
+        for col in ("user_type", "bike_type", "status"):
+            self.trips[col] = _normalize_categorical(self.trips[col])
+        for col in ("bike_type", "maintenance_type"):
+            self.maintenance[col] = _normalize_categorical(self.maintenance[col])
+
+        # ---- Drop duplicate, incomplete and invalid trips in one pass ----
+        start = self.trips["start_time"]
+        end = self.trips["end_time"]
+        mask = (
+            ~self.trips["trip_id"].duplicated().to_numpy()
+            & self.trips["trip_id"].notna().to_numpy()
+            & start.notna().to_numpy()
+            & end.notna().to_numpy()
+            & (end >= start).to_numpy()
+            & ~(self.trips["distance_km"] < 0).to_numpy()
+            & _category_mask(self.trips["bike_type"], VALID_BIKE_TYPES)
+            & _category_mask(self.trips["user_type"], VALID_USER_TYPES)
+        )
+        self.trips = self.trips.loc[mask]
 
-        # ---- Handle missing values ----
-        self.trips = self.trips.dropna(subset=["trip_id", "start_time", "end_time"])
+        # ---- Handle missing values (surviving rows only) ----
         self.trips["distance_km"] = self.trips["distance_km"].fillna(self.trips["distance_km"].median())
         self.trips["duration_minutes"] = self.trips["duration_minutes"].fillna(self.trips["duration_minutes"].median())
 
-        # ---- Remove invalid trips ----
-        self.trips = self.trips[self.trips["end_time"] >= self.trips["start_time"]]
-
-        # ---- Standardize categoricals ----
-        self.trips["user_type"] = self.trips["user_type"].str.lower().str.strip()
-        self.trips["status"] = self.trips["status"].str.lower().str.strip()
-        self.maintenance["maintenance_type"] = self.maintenance["maintenance_type"].str.lower().str.strip()
-
-        # Validate values
-        self.trips = self.trips[self.trips["bike_type"].isin(VALID_BIKE_TYPES)]
-        self.trips = self.trips[self.trips["user_type"].isin(VALID_USER_TYPES)]
         self.maintenance = self.maintenance[self.maintenance["maintenance_type"].isin(VALID_MAINTENANCE_TYPES)]
 
+        # ---- Precompute timestamp fields reused by the analytics ----
+        self.trips["start_hour"] = self.trips["start_time"].dt.hour.astype("int8")
+        self.trips["start_day"] = self.trips["start_time"].dt.day_name().astype("category")
+
         # ---- Export cleaned data ----
         DATA_DIR.mkdir(exist_ok=True)
-        self.trips.to_csv(DATA_DIR / "trips_clean.csv", index=False)
-        self.stations.to_csv(DATA_DIR / "stations_clean.csv", index=False)
-        self.maintenance.to_csv(DATA_DIR / "maintenance_clean.csv", index=False)
+        self.trips.to_parquet(DATA_DIR / "trips_clean.parquet", **PARQUET_OPTIONS)
+        self.stations.to_parquet(DATA_DIR / "stations_clean.parquet", **PARQUET_OPTIONS)
+        self.maintenance.to_parquet(DATA_DIR / "maintenance_clean.parquet", **PARQUET_OPTIONS)
 
         print("Data cleaning complete.")
 
     # ------------------------------------------------------------------
     # NumPy-based calculations 
     # ------------------------------------------------------------------
+    def _set_trip_column(self, name: str, values: np.ndarray) -> None:
+        """Store a computed trips column and drop analytics computed before it."""
+        self._cache.clear()
+        self.trips[name] = values
+
     def build_station_distance_matrix(self):
-        """Compute pairwise distances between stations."""
-        lats = self.stations["latitude"].to_numpy()
-        lons = self.stations["longitude"].to_numpy()
-        self.station_ids = self.stations["station_id"].to_numpy()
-        self.station_distances = station_distance_matrix(lats, lons)
+        """Compute pairwise distances between stations (in station table order)."""
+        self.station_distances = station_distance_matrix(self.station_lat, self.station_lon)
+
+    def _station_index(self, station_ids: np.ndarray) -> np.ndarray:
+        """Map station IDs to rows of the stations table (and distance matrix)."""
+        pos = binary_search_batch(self.station_ids_sorted, station_ids)
+        if (pos < 0).any():
+            raise ValueError("Trips reference unknown station IDs")
+        return self.station_order[pos]
 
     def add_trip_distances(self):
         """Assign distance to each trip using station distance matrix."""
-        id_to_idx = {sid: i for i, sid in enumerate(self.station_ids)}
-        start_idx = self.trips["start_station_id"].map(id_to_idx).to_numpy()
-        end_idx = self.trips["end_station_id"].map(id_to_idx).to_numpy()
-        self.trips["distance"] = self.station_distances[start_idx, end_idx]
+        start_idx = self._station_index(self.trips["start_station_id"].to_numpy())
+        end_idx = self._station_index(self.trips["end_station_id"].to_numpy())
+        self._set_trip_column("distance", self.station_distances[start_idx, end_idx])
 
     def flag_duration_outliers(self, threshold=3.0):
         """Mark trips with z-score outliers."""
-        self.trips["is_outlier"] = detect_outliers_zscore(
+        self._set_trip_column("is_outlier", detect_outliers_zscore(
             self.trips["duration_minutes"].to_numpy(), threshold
-        )
+        ))
 
     def compute_fares(self):
-        fares = []
-        for _, row in self.trips.iterrows():
-            if row.user_type == "casual":
-                strategy = CasualPricing()
-            elif row.user_type == "member":
-                strategy = MemberPricing()
-            else:
-                strategy = CasualPricing()
-
-            if 7 <= row.start_time.hour <= 9 or 17 <= row.start_time.hour <= 19:
-                strategy = PeakHourPricing()
-
-            fare = strategy.calculate_cost(row.duration_minutes, row.distance)
-            fares.append(fare)
-
-        self.trips["fare"] = fares
-
-    def save_trips_with_numerical(self, path=DATA_DIR / "trips_clean.csv"):
-        """Save trips with added numerical columns to CSV."""
-        self.trips.to_csv(path, index=False)
+        """Compute all trip fares, one vectorized call per pricing strategy."""
+        durations = self.trips["duration_minutes"].to_numpy()
+        distances = self.trips["distance"].to_numpy()
+        hours = self.trips["start_hour"].to_numpy()
+        is_member = _category_mask(self.trips["user_type"], frozenset({"member"}))
+        # Peak hours apply to every user: casual rates plus the surcharge
+        is_peak = ((7 <= hours) & (hours <= 9)) | ((17 <= hours) & (hours <= 19))
+
+        strategy_masks = (
+            (PeakHourPricing(), is_peak),
+            (MemberPricing(), is_member & ~is_peak),
+            (CasualPricing(), ~is_member & ~is_peak),
+        )
+        fares = np.empty(len(durations), dtype=np.float64)
+        for strategy, mask in strategy_masks:
+            fares[mask] = strategy.calculate_costs(durations[mask], distances[mask])
+        self._set_trip_column("fare", fares)
+
+    def save_trips_with_numerical(self, path=DATA_DIR / "trips_clean.parquet"):
+        """Save trips with added numerical columns to Parquet."""
+        self.trips.to_parquet(path, **PARQUET_OPTIONS)
         print(f"[OK] Saved {path}")
 
+    # ------------------------------------------------------------------
+    # On-demand domain objects
+    # ------------------------------------------------------------------
+    def _station_object(self, station_id: str) -> Station:
+        row = self.stations.iloc[self._station_index(np.array([station_id]))[0]]
+        if pd.isna(row["capacity"]):
+            raise ValueError(f"Station {station_id} has no capacity")
+        return Station(
+            station_id=row["station_id"],
+            name=row["station_name"],
+            capacity=int(row["capacity"]),
+            latitude=float(row["latitude"]),
+            longitude=float(row["longitude"]),
+        )
+
+    def get_trip(self, i: int) -> Trip:
+        """
+        Materialize the i-th trip as a Trip object.
+
+        The DataFrame stays the source of truth; objects are only built
+        when a caller asks for one.
+        """
+        data = self.trips.iloc[i].to_dict()
+        start = self._station_object(data["start_station_id"])
+        end = (start if data["end_station_id"] == data["start_station_id"]
+               else self._station_object(data["end_station_id"]))
+        return Trip(
+            trip_id=data["trip_id"],
+            user=create_user(data),
+            bike=create_bike(data),
+            start_station=start,
+            end_station=end,
+            start_time=pd.Timestamp(data["start_time"]),
+            end_time=pd.Timestamp(data["end_time"]),
+            # Via str: shortest decimal of the float32 value (4.28, not 4.2800002098...)
+            distance_km=float(str(np.float32(data["distance_km"]))),
+        )
 
+    @_cached
     def popular_routes(self, n: int = 10) -> pd.DataFrame:
         """Compute top-N popular routes with station names."""
         # Group by start and end station IDs and count trips
-        df = self.trips.groupby(['start_station_id', 'end_station_id']).size().reset_index(name='trip_count')
-
-        # Merge start station names
-        df = df.merge(
-            self.stations[['station_id', 'station_name']],
-            left_on='start_station_id', right_on='station_id', how='left'
-        ).rename(columns={'station_name': 'start_station_name'}).drop('station_id', axis=1)
-
-        # Merge end station names
-        df = df.merge(
-            self.stations[['station_id', 'station_name']],
-            left_on='end_station_id', right_on='station_id', how='left'
-        ).rename(columns={'station_name': 'end_station_name'}).drop('station_id', axis=1)
+        df = self.trips.groupby(
+            ['start_station_id', 'end_station_id'], sort=False, observed=True
+        ).size().reset_index(name='trip_count')
 
-        # Sort by trip count descending
-        df = df.sort_values('trip_count', ascending=False)
+        # Attach start and end station names with hashed lookups (no joins)
+        name_map = dict(zip(self.stations['station_id'].to_numpy(),
+                            self.stations['station_name'].to_numpy()))
+        df['start_station_name'] = df['start_station_id'].map(name_map)
+        df['end_station_name'] = df['end_station_id'].map(name_map)
 
-        return df.head(n)
+        # Top-N by trip count (partial selection, no full sort)
+        return df.nlargest(n, 'trip_count')
 
 
+    @_cached
     def maintenance_cost_by_bike_type(self) -> pd.DataFrame:
         """Compute total and average maintenance cost per bike type."""
         # Group maintenance records by bike type and calculate sum and mean
-        df = self.maintenance.groupby('bike_type')['cost'].agg(['sum', 'mean']).reset_index()
+        df = self.maintenance.groupby('bike_type', sort=False)['cost'].agg(['sum', 'mean']).reset_index()
+        # Costs are stored as float32; report them as float64 currency values
+        df[['sum', 'mean']] = df[['sum', 'mean']].astype('float64').round(2)
 
         # Sort by total cost descending
         df = df.sort_values('sum', ascending=False)
@@ -161,66 +395,71 @@ class BikeShareSystem:
         return df
 
 
+    @_cached
     def bike_utilization_rate(self) -> pd.DataFrame:
         """
         Computes the total usage duration per bike.
         Ensures each bike ID is unique by removing duplicate type entries.
         """
-        # Sum total duration for each bike ID
-        util = self.trips.groupby('bike_id')['duration_minutes'].sum().reset_index(name='total_usage_min')
-
-        # Create a unique mapping of bike_id to bike_type to prevent duplicates on charts
-        # subset=['bike_id'] ensures BK312 (and others) appear only once
-        bike_types = self.trips[['bike_id', 'bike_type']].drop_duplicates(subset=['bike_id'])
-
-        # Merge duration with bike types using a left join
-        util = util.merge(bike_types, on='bike_id', how='left')
+        # Sum duration and take the first recorded bike type in a single pass,
+        # so each bike ID appears only once (BK312 and others)
+        util = self.trips.groupby('bike_id', sort=False, observed=True).agg(
+            total_usage_min=('duration_minutes', 'sum'),
+            bike_type=('bike_type', 'first'),
+        ).reset_index()
+        util['total_usage_min'] = util['total_usage_min'].astype('float64').round(2)
 
         # Sort by duration in descending order for top-N analysis
         return util.sort_values('total_usage_min', ascending=False)
 
+    @_cached
     def abandoned_bikes(self) -> pd.DataFrame:
         """Identify bikes with anomalous trips (outliers)."""
         # Filter trips flagged as outliers
         outliers = self.trips[self.trips['is_outlier']]
 
         # Count number of outlier trips per bike
-        df = outliers.groupby('bike_id').size().reset_index(name='num_outliers')
+        df = outliers.groupby('bike_id', sort=False, observed=True).size().reset_index(name='num_outliers')
 
         # Sort descending by number of outliers
         return df.sort_values('num_outliers', ascending=False)
 
 
+    @_cached
     def average_revenue_per_user(self) -> float:
         """Compute average revenue per user (ARPU)."""
         # Sum fares per user
-        user_revenue = self.trips.groupby('user_id')['fare'].sum()
+        user_revenue = self.trips.groupby('user_id', sort=False, observed=True)['fare'].sum()
 
         # Compute mean and round to 2 decimals
         return round(user_revenue.mean(), 2)
     
+    @_cached
     def top_active_users(self, n: int = 15) -> pd.DataFrame:
         """Compute top-N active users by total usage minutes and number of trips."""
-        df = self.trips.groupby(['user_id', 'user_type']).agg(
+        df = self.trips.groupby(['user_id', 'user_type'], sort=False, observed=True).agg(
             total_trips=('trip_id', 'count'),
             total_usage_min=('duration_minutes', 'sum')
         ).reset_index()
-        df['total_usage_min'] = df['total_usage_min'].round(2)
-        df = df.sort_values('total_usage_min', ascending=False).head(n)
-        return df
+        df['total_usage_min'] = df['total_usage_min'].astype('float64').round(2)
+        return df.nlargest(n, 'total_usage_min')
 
 
     # ------------------------------------------------------------------
     #     Analytics und Summary Reports
     # ------------------------------------------------------------------
+    @_cached
     def total_trips_summary(self) -> dict:
         df = self.trips
+        # Both reductions in one agg call, each column walked once
+        res = df.agg({"distance_km": "sum", "duration_minutes": "mean"})
         return {
             "total_trips": len(df),
-            "total_distance_km": round(df["distance_km"].sum(), 2),
-            "avg_duration_min": round(df["duration_minutes"].mean(), 2),
+            "total_distance_km": round(float(res["distance_km"]), 2),
+            "avg_duration_min": round(float(res["duration_minutes"]), 2),
         }
 
+    @_cached
     def top_start_stations(self, n: int = 10) -> pd.DataFrame:
         counts = self.trips["start_station_id"].value_counts().head(n).reset_index()
         counts.columns = ["station_id", "trip_count"]
@@ -232,12 +471,15 @@ class BikeShareSystem:
         return counts[["station_name", "trip_count"]]
 
 
+    @_cached
     def peak_usage_hours(self) -> pd.Series:
-        return self.trips["start_time"].dt.hour.value_counts().sort_index()
+        return self.trips["start_hour"].value_counts().sort_index().rename_axis("start_time")
 
+    @_cached
     def busiest_day_of_week(self) -> pd.Series:
-        return self.trips["start_time"].dt.day_name().value_counts()
+        return self.trips["start_day"].value_counts().rename_axis("start_time")
 
+    @_cached
     def avg_distance_by_user_type(self) -> pd.Series:
         return self.trips.groupby("user_type")["distance_km"].mean()
 
@@ -1,33 +1,68 @@
-from datetime import datetime
+import numpy as np
+import pandas as pd
+from utils import DATE_FORMAT, DATETIME_FORMAT, parse_date, parse_datetime
 from models import (
     Bike, ClassicBike, ElectricBike, 
     User, CasualUser, MemberUser, 
-    Station, Trip, MaintenanceRecord
+    Station, Trip, MaintenanceRecord, ingest_timestamp
 )
 
+def _make_classic_bike(bike_id: str, data: dict) -> Bike:
+    return ClassicBike(
+        bike_id=bike_id, 
+        gear_count=int(data.get("gear_count", 7))
+    )
+
+def _make_electric_bike(bike_id: str, data: dict) -> Bike:
+    return ElectricBike(
+        bike_id=bike_id,
+        battery_level=float(data.get("battery_level", 100.0)),
+        max_range_km=float(data.get("max_range_km", 50.0))
+    )
+
+_BIKE_CONSTRUCTORS = {
+    "classic": _make_classic_bike,
+    "electric": _make_electric_bike,
+}
+
 def create_bike(data: dict) -> Bike:
-    bike_type = data.get("bike_type", "").lower().strip()
+    # Callers pass canonical values (clean_data normalizes the columns once)
+    bike_type = data.get("bike_type", "")
+    assert bike_type == bike_type.lower().strip(), f"bike_type not normalized: {bike_type!r}"
     bike_id = data.get("bike_id")
 
     if not bike_id:
         raise ValueError("Bike ID is required")
 
-    if bike_type == "classic":
-        return ClassicBike(
-            bike_id=bike_id, 
-            gear_count=int(data.get("gear_count", 7))
-        )
-    elif bike_type == "electric":
-        return ElectricBike(
-            bike_id=bike_id,
-            battery_level=float(data.get("battery_level", 100.0)),
-            max_range_km=float(data.get("max_range_km", 50.0))
-        )
-    else:
+    constructor = _BIKE_CONSTRUCTORS.get(bike_type)
+    if constructor is None:
         raise ValueError(f"Unknown bike_type: {bike_type!r}")
+    return constructor(bike_id, data)
+
+def _make_casual_user(user_id: str, name: str, email: str, data: dict) -> User:
+    return CasualUser(
+        user_id=user_id, 
+        name=name, 
+        email=email, 
+        day_pass_count=int(data.get("day_pass_count", 0))
+    )
+
+def _make_member_user(user_id: str, name: str, email: str, data: dict) -> User:
+    return MemberUser(
+        user_id=user_id, 
+        name=name, 
+        email=email, 
+        tier=data.get("tier", "basic")
+    )
+
+_USER_CONSTRUCTORS = {
+    "casual": _make_casual_user,
+    "member": _make_member_user,
+}
 
 def create_user(data: dict) -> User:
-    user_type = data.get("user_type", "").lower().strip()
+    user_type = data.get("user_type", "")
+    assert user_type == user_type.lower().strip(), f"user_type not normalized: {user_type!r}"
     user_id = data.get("user_id")
     name = data.get("name", "Unknown")
     email = data.get("email", "unknown@example.com")
@@ -35,22 +70,10 @@ def create_user(data: dict) -> User:
     if not user_id:
         raise ValueError("User ID is required")
 
-    if user_type == "casual":
-        return CasualUser(
-            user_id=user_id, 
-            name=name, 
-            email=email, 
-            day_pass_count=int(data.get("day_pass_count", 0))
-        )
-    elif user_type == "member":
-        return MemberUser(
-            user_id=user_id, 
-            name=name, 
-            email=email, 
-            tier=data.get("tier", "basic")
-        )
-    else:
+    constructor = _USER_CONSTRUCTORS.get(user_type)
+    if constructor is None:
         raise ValueError(f"Unknown user_type: {user_type!r}")
+    return constructor(user_id, name, email, data)
 
 def create_station(data: dict) -> Station:
     return Station(
@@ -63,15 +86,14 @@ def create_station(data: dict) -> Station:
 
 def create_trip(data: dict, user: User, bike: Bike, 
                 start_station: Station, end_station: Station) -> Trip:
-    fmt = "%Y-%m-%d %H:%M:%S"
     return Trip(
         trip_id=data["trip_id"],
         user=user,
         bike=bike,
         start_station=start_station,
         end_station=end_station,
-        start_time=datetime.strptime(data["start_time"], fmt),
-        end_time=datetime.strptime(data["end_time"], fmt),
+        start_time=parse_datetime(data["start_time"]),
+        end_time=parse_datetime(data["end_time"]),
         distance_km=float(data["distance_km"])
     )
 
@@ -79,8 +101,82 @@ def create_maintenance_record(data: dict, bike: Bike) -> MaintenanceRecord:
     return MaintenanceRecord(
         record_id=data["record_id"],
         bike=bike,
-        date=datetime.strptime(data["maintenance_date"], "%Y-%m-%d"),
+        date=parse_date(data["maintenance_date"]),
         maintenance_type=data["maintenance_type"],
         cost=float(data["cost"]),
         description=data["description"]
-    )
\ No newline at end of file
+    )
+
+def _check_rows(ids: pd.Series, checks: dict[str, np.ndarray]) -> None:
+    """Raise a single ValueError listing every row that fails any of the checks."""
+    problems = []
+    for reason, bad in checks.items():
+        if bad.any():
+            bad_ids = ids.to_numpy()[bad]
+            sample = ", ".join(map(str, bad_ids[:5]))
+            problems.append(f"{reason}: {len(bad_ids)} row(s), e.g. {sample}")
+    if problems:
+        raise ValueError("Invalid rows:\n  " + "\n  ".join(problems))
+
+def create_trips_bulk(df: pd.DataFrame, users: dict[str, User], bikes: dict[str, Bike],
+                      stations: dict[str, Station]) -> list[Trip]:
+    """
+    Build Trip objects for every row of a trips DataFrame.
+
+    Timestamps are parsed column-wise (one vectorized pass with a cache)
+    instead of one strptime call per row, and the Trip invariants are checked
+    as column masks so all bad rows are reported in one ValueError. users,
+    bikes and stations map IDs to the already-built objects.
+    """
+    start = pd.to_datetime(df["start_time"], format=DATETIME_FORMAT, cache=True)
+    end = pd.to_datetime(df["end_time"], format=DATETIME_FORMAT, cache=True)
+    distance = df["distance_km"].astype("float64")
+    _check_rows(df["trip_id"], {
+        "end_time before start_time": (end < start).to_numpy(),
+        "negative distance_km": (distance < 0).to_numpy(),
+    })
+
+    return [
+        Trip(
+            trip_id=trip_id,
+            user=users[user_id],
+            bike=bikes[bike_id],
+            start_station=stations[start_id],
+            end_station=stations[end_id],
+            start_time=start_time,
+            end_time=end_time,
+            distance_km=distance_km,
+            validate=False
+        )
+        for trip_id, user_id, bike_id, start_id, end_id, start_time, end_time, distance_km in zip(
+            df["trip_id"], df["user_id"], df["bike_id"],
+            df["start_station_id"], df["end_station_id"],
+            start, end, distance
+        )
+    ]
+
+def create_maintenance_records_bulk(df: pd.DataFrame, bikes: dict[str, Bike]) -> list[MaintenanceRecord]:
+    """Build MaintenanceRecord objects for every row, parsing and validating column-wise."""
+    dates = pd.to_datetime(df["maintenance_date"], format=DATE_FORMAT, cache=True)
+    cost = df["cost"].astype("float64")
+    _check_rows(df["record_id"], {
+        "unknown maintenance_type": ~df["maintenance_type"].isin(MaintenanceRecord.VALID_TYPES).to_numpy(),
+        "non-positive cost": (cost <= 0).to_numpy(),
+    })
+
+    with ingest_timestamp():
+        return [
+            MaintenanceRecord(
+                record_id=record_id,
+                bike=bikes[bike_id],
+                date=date,
+                maintenance_type=maintenance_type,
+                cost=record_cost,
+                description=description,
+                validate=False
+            )
+            for record_id, bike_id, date, maintenance_type, record_cost, description in zip(
+                df["record_id"], df["bike_id"], dates,
+                df["maintenance_type"], cost, df["description"]
+            )
+        ]
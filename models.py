@@ -1,18 +1,38 @@
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
 from utils import validate_email, validate_positive
 
 
+# Shared created_at for entities built inside ingest_timestamp()
+_ingest_now: datetime | None = None
+
+
+@contextmanager
+def ingest_timestamp(now: datetime = None):
+    """Stamp every Entity created in this block with one timestamp."""
+    global _ingest_now
+    previous = _ingest_now
+    _ingest_now = now or datetime.now()
+    try:
+        yield _ingest_now
+    finally:
+        _ingest_now = previous
+
+
 # ---------------------------------------------------------------------------
 # Abstract Base Class
 # ---------------------------------------------------------------------------
 
 class Entity(ABC):
+    __slots__ = ("id", "created_at")
+
     def __init__(self, entity_id: str, created_at: datetime = None):
         if not entity_id:
             raise ValueError("ID cannot be empty")
         self.id = entity_id
-        self.created_at = created_at or datetime.now()
+        self.created_at = created_at or _ingest_now or datetime.now()
 
     @abstractmethod
     def __str__(self):
@@ -28,28 +48,35 @@ class Entity(ABC):
 # ---------------------------------------------------------------------------
 
 class Bike(Entity):
-    VALID_STATUSES = {"available", "in_use", "maintenance"}
+    __slots__ = ("bike_type", "status")
 
-    def __init__(self, bike_id: str, bike_type: str, status: str = "available"):
-        super().__init__(bike_id)
+    VALID_STATUSES = frozenset({"available", "in_use", "maintenance"})
 
+    def __init__(self, bike_id: str, bike_type: str, status: str = "available"):
+        # Cheap invariants first so rejected rows skip Entity construction
         if status not in self.VALID_STATUSES:
             raise ValueError("Invalid bike status")
 
-        self.bike_type = bike_type
-        self.status = status
+        super().__init__(bike_id)
+
+        # Interned: a handful of distinct values shared by every instance
+        # (str() first: sys.intern rejects subclasses such as numpy.str_)
+        self.bike_type = sys.intern(str(bike_type))
+        self.status = sys.intern(str(status))
 
     def __repr__(self):
         return f"Bike(id='{self.id}', type='{self.bike_type}', status='{self.status}')"
 
 
 class ClassicBike(Bike):
-    def __init__(self, bike_id: str, gear_count: int = 1, status: str = "available"):
-        super().__init__(bike_id, "classic", status)
+    __slots__ = ("gear_count",)
 
+    def __init__(self, bike_id: str, gear_count: int = 1, status: str = "available"):
         if gear_count <= 0:
             raise ValueError("gear_count must be positive")
 
+        super().__init__(bike_id, "classic", status)
+
         self.gear_count = gear_count
 
     def __str__(self):
@@ -57,6 +84,8 @@ class ClassicBike(Bike):
 
 
 class ElectricBike(Bike):
+    __slots__ = ("battery_level", "max_range_km")
+
     def __init__(
         self,
         bike_id: str,
@@ -64,13 +93,13 @@ class ElectricBike(Bike):
         max_range_km: float = 50.0,
         status: str = "available",
     ):
-        super().__init__(bike_id, "electric", status)
-
         if not 0 <= battery_level <= 100:
             raise ValueError("battery_level must be between 0 and 100")
         if max_range_km <= 0:
             raise ValueError("max_range_km must be positive")
 
+        super().__init__(bike_id, "electric", status)
+
         self.battery_level = validate_positive(battery_level, "Battery level")
         self.max_range_km = validate_positive(max_range_km, "Max range")
 
@@ -83,15 +112,14 @@ class ElectricBike(Bike):
 # ---------------------------------------------------------------------------
 
 class User(Entity):
+    __slots__ = ("name", "email", "user_type")
+
     def __init__(self, user_id: str, name: str, email: str, user_type: str):
         super().__init__(user_id)
 
-        if "@" not in email:
-            raise ValueError("Invalid email format")
-
         self.name = name
         self.email = validate_email(email)
-        self.user_type = user_type
+        self.user_type = sys.intern(str(user_type))
 
     def __str__(self):
         return f"User: {self.name} ({self.email})"
@@ -101,6 +129,8 @@ class User(Entity):
 
 
 class CasualUser(User):
+    __slots__ = ("day_pass_count",)
+
     def __init__(self, user_id: str, name: str, email: str, day_pass_count: int = 0):
         if day_pass_count < 0:
             raise ValueError("day_pass_count cannot be negative")
@@ -112,6 +142,8 @@ class CasualUser(User):
 
 
 class MemberUser(User):
+    __slots__ = ("membership_start", "membership_end", "tier")
+
     def __init__(
         self,
         user_id: str,
@@ -131,7 +163,7 @@ class MemberUser(User):
 
         self.membership_start = membership_start
         self.membership_end = membership_end
-        self.tier = tier
+        self.tier = sys.intern(str(tier))
 
     def __str__(self):
         return f"Member User ({self.tier}): {self.name}"
@@ -142,6 +174,8 @@ class MemberUser(User):
 # ---------------------------------------------------------------------------
 
 class Station(Entity):
+    __slots__ = ("name", "capacity", "latitude", "longitude")
+
     def __init__(
         self,
         station_id: str,
@@ -150,8 +184,6 @@ class Station(Entity):
         latitude: float,
         longitude: float,
     ):
-        super().__init__(station_id)
-
         if capacity <= 0:
             raise ValueError("capacity must be positive")
         if not -90 <= latitude <= 90:
@@ -159,6 +191,8 @@ class Station(Entity):
         if not -180 <= longitude <= 180:
             raise ValueError("Invalid longitude")
 
+        super().__init__(station_id)
+
         self.name = name
         self.capacity = validate_positive(capacity, "Station capacity")
         self.latitude = latitude
@@ -176,6 +210,11 @@ class Station(Entity):
 # ---------------------------------------------------------------------------
 
 class Trip:
+    __slots__ = (
+        "trip_id", "user", "bike", "start_station", "end_station",
+        "start_time", "end_time", "distance_km", "duration_minutes",
+    )
+
     def __init__(
         self,
         trip_id: str,
@@ -186,11 +225,14 @@ class Trip:
         start_time: datetime,
         end_time: datetime,
         distance_km: float,
+        validate: bool = True,
     ):
-        if end_time < start_time:
-            raise ValueError("End time before start time")
-        if distance_km < 0:
-            raise ValueError("distance_km cannot be negative")
+        # Bulk ingest validates whole columns up front and passes validate=False
+        if validate:
+            if end_time < start_time:
+                raise ValueError("End time before start time")
+            if distance_km < 0:
+                raise ValueError("distance_km cannot be negative")
 
         self.trip_id = trip_id
         self.user = user
@@ -200,10 +242,8 @@ class Trip:
         self.start_time = start_time
         self.end_time = end_time
         self.distance_km = distance_km
-
-    @property
-    def duration_minutes(self):
-        return (self.end_time - self.start_time).total_seconds() / 60
+        # Stored once: trips are not re-timed after construction
+        self.duration_minutes = (end_time - start_time).total_seconds() / 60
 
     def __str__(self):
         return f"Trip {self.trip_id}: {self.user.name} ({self.distance_km} km)"
@@ -217,13 +257,15 @@ class Trip:
 # ---------------------------------------------------------------------------
 
 class MaintenanceRecord(Entity):
-    VALID_TYPES = {
+    __slots__ = ("bike", "date", "maintenance_type", "cost", "description")
+
+    VALID_TYPES = frozenset({
         "tire_repair",
         "brake_adjustment",
         "battery_replacement",
         "chain_lubrication",
         "general_inspection",
-    }
+    })
 
     def __init__(
         self,
@@ -233,18 +275,21 @@ class MaintenanceRecord(Entity):
         maintenance_type: str,
         cost: float,
         description: str,
+        validate: bool = True,
     ):
-        super().__init__(record_id)
+        if validate:
+            if maintenance_type not in self.VALID_TYPES:
+                raise ValueError("Invalid maintenance type")
+            if cost < 0:
+                raise ValueError("Maintenance cost cannot be negative")
+            validate_positive(cost, "Maintenance cost")
 
-        if maintenance_type not in self.VALID_TYPES:
-            raise ValueError("Invalid maintenance type")
-        if cost < 0:
-            raise ValueError("Maintenance cost cannot be negative")
+        super().__init__(record_id)
 
         self.bike = bike
         self.date = date
-        self.maintenance_type = maintenance_type
-        self.cost = validate_positive(cost, "Maintenance cost") 
+        self.maintenance_type = sys.intern(str(maintenance_type))
+        self.cost = cost
         self.description = description
 
     def __str__(self):
@@ -1,5 +1,7 @@
 import numpy as np
 
+EARTH_RADIUS_KM = 6371.0
+
 # ---------------------------------------------------------------------------
 # Distance calculations
 # ---------------------------------------------------------------------------
@@ -7,12 +9,17 @@ import numpy as np
 def station_distance_matrix(
     latitudes: np.ndarray, longitudes: np.ndarray
 ) -> np.ndarray:
-    """Compute pairwise Euclidean distances between stations."""
+    """Compute pairwise great-circle (haversine) distances in km between stations."""
+    lat = np.deg2rad(latitudes)
+    lon = np.deg2rad(longitudes)
 
-    lat_diff = latitudes[:, np.newaxis] - latitudes[np.newaxis, :]
-    lon_diff = longitudes[:, np.newaxis] - longitudes[np.newaxis, :]
+    lat_diff = lat[:, np.newaxis] - lat[np.newaxis, :]
+    lon_diff = lon[:, np.newaxis] - lon[np.newaxis, :]
+    cos_lat = np.cos(lat)
 
-    distances = np.sqrt(lat_diff**2 + lon_diff**2)
+    a = (np.sin(lat_diff / 2) ** 2
+         + cos_lat[:, np.newaxis] * cos_lat[np.newaxis, :] * np.sin(lon_diff / 2) ** 2)
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
     return distances
 
 
@@ -40,14 +47,16 @@ def detect_outliers_zscore(
     values: np.ndarray, threshold: float = 3.0
 ) -> np.ndarray:
     """Identify outlier indices using the z-score method."""
-    mean = np.mean(values)
-    std = np.std(values)
+    # One deviation array serves both the variance and the comparison;
+    # |x - mean| > threshold * std avoids dividing the whole array by std.
+    dev = values - np.mean(values)
+    std = np.sqrt(np.dot(dev, dev) / dev.size)
 
     if std == 0:
         return np.zeros_like(values, dtype=bool)
 
-    z_scores = (values - mean) / std
-    return np.abs(z_scores) > threshold
+    np.abs(dev, out=dev)
+    return dev > threshold * std
 
 
 # ---------------------------------------------------------------------------
@@ -62,4 +71,8 @@ def calculate_fares(
     unlock_fee: float = 0.0,
 ) -> np.ndarray:
     """Calculate fares for many trips at once using NumPy."""
-    return unlock_fee + per_minute * durations + per_km * distances
+    # Accumulate in place to avoid a temporary array per arithmetic step
+    fares = np.multiply(durations, per_minute, dtype=np.float64)
+    fares += np.multiply(distances, per_km)
+    fares += unlock_fee
+    return fares
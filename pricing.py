@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import numpy as np
+from numerical import calculate_fares
 
 # ---------------------------------------------------------------------------
 # Strategy interface
@@ -12,6 +14,13 @@ class PricingStrategy(ABC):
         """Return the trip cost in euros."""
         ...
 
+    def calculate_costs(self, duration_minutes: np.ndarray, distance_km: np.ndarray) -> np.ndarray:
+        """Return the cost of many trips at once (element-wise fallback)."""
+        return np.fromiter(
+            (self.calculate_cost(d, k) for d, k in zip(duration_minutes, distance_km)),
+            dtype=np.float64, count=len(duration_minutes),
+        )
+
 # ---------------------------------------------------------------------------
 # Concrete strategies
 # ---------------------------------------------------------------------------
@@ -25,6 +34,9 @@ class CasualPricing(PricingStrategy):
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         return self.UNLOCK_FEE + self.PER_MINUTE * duration_minutes + self.PER_KM * distance_km
 
+    def calculate_costs(self, duration_minutes: np.ndarray, distance_km: np.ndarray) -> np.ndarray:
+        return calculate_fares(duration_minutes, distance_km, self.PER_MINUTE, self.PER_KM, self.UNLOCK_FEE)
+
 class MemberPricing(PricingStrategy):
     """Pricing for member users — discounted rates."""
     PER_MINUTE = 0.08
@@ -33,11 +45,21 @@ class MemberPricing(PricingStrategy):
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         return self.PER_MINUTE * duration_minutes + self.PER_KM * distance_km
 
+    def calculate_costs(self, duration_minutes: np.ndarray, distance_km: np.ndarray) -> np.ndarray:
+        return calculate_fares(duration_minutes, distance_km, self.PER_MINUTE, self.PER_KM)
+
 class PeakHourPricing(PricingStrategy):
     """Pricing during peak hours (surcharge on top of casual rates)."""
     MULTIPLIER = 1.5
+    # Shared, stateless base strategy — no allocation per calculation
+    _BASE = CasualPricing()
 
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
-        base_cost = CasualPricing().calculate_cost(duration_minutes, distance_km)
+        base_cost = self._BASE.calculate_cost(duration_minutes, distance_km)
         return base_cost * self.MULTIPLIER
 
+    def calculate_costs(self, duration_minutes: np.ndarray, distance_km: np.ndarray) -> np.ndarray:
+        costs = self._BASE.calculate_costs(duration_minutes, distance_km)
+        costs *= self.MULTIPLIER
+        return costs
+
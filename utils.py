@@ -5,6 +5,7 @@ Provides validation, date parsing, and formatting functions.
 Keep I/O-free — these are pure helper functions.
 """
 
+import re
 from datetime import datetime
 from typing import Any
 
@@ -15,16 +16,20 @@ from typing import Any
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-VALID_BIKE_TYPES = {"classic", "electric"}
-VALID_USER_TYPES = {"casual", "member"}
-VALID_TRIP_STATUSES = {"completed", "cancelled"}
-VALID_MAINTENANCE_TYPES = {
+# Also usable column-wise, e.g. Series.str.fullmatch(EMAIL_PATTERN)
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+VALID_BIKE_TYPES = frozenset({"classic", "electric"})
+VALID_USER_TYPES = frozenset({"casual", "member"})
+VALID_TRIP_STATUSES = frozenset({"completed", "cancelled"})
+VALID_MAINTENANCE_TYPES = frozenset({
     "tire_repair",
     "brake_adjustment",
     "battery_replacement",
     "chain_lubrication",
     "general_inspection",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Validation helpers
@@ -41,7 +46,7 @@ def validate_non_negative(value: float, name: str = "value") -> float:
     return value
 
 def validate_email(email: str) -> str:
-    if not isinstance(email, str) or "@" not in email:
+    if not isinstance(email, str) or not _EMAIL_RE.fullmatch(email):
         raise ValueError(f"Invalid email: {email!r}")
     return email
 
@@ -54,11 +59,25 @@ def validate_in(value: Any, allowed: set, name: str = "value") -> Any:
 # Parsing helpers
 # ---------------------------------------------------------------------------
 
+# Text laid out exactly like DATETIME_FORMAT / DATE_FORMAT is parsed by the
+# C-level datetime.fromisoformat. Anything else, including other ISO 8601 forms
+# ("T" separator, UTC offsets, week dates), goes to strptime, which enforces
+# the format.
+_DATE_SEPARATORS = {4: "-", 7: "-"}
+_DATETIME_SEPARATORS = {4: "-", 7: "-", 10: " ", 13: ":", 16: ":"}
+
+def _parse_fixed(text: str, fmt: str, length: int, separators: dict[int, str]) -> datetime:
+    if isinstance(text, str) and len(text) == length and all(text[i] == c for i, c in separators.items()):
+        parsed = datetime.fromisoformat(text)
+        if parsed.tzinfo is None:
+            return parsed
+    return datetime.strptime(text, fmt)
+
 def parse_datetime(text: str) -> datetime:
-    return datetime.strptime(text, DATETIME_FORMAT)
+    return _parse_fixed(text, DATETIME_FORMAT, 19, _DATETIME_SEPARATORS)
 
 def parse_date(text: str) -> datetime:
-    return datetime.strptime(text, DATE_FORMAT)
+    return _parse_fixed(text, DATE_FORMAT, 10, _DATE_SEPARATORS)
 
 # ---------------------------------------------------------------------------
 # Formatting helpers